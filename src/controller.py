@@ -2,7 +2,7 @@
 #
 # Der Controller verbindet:
 #   - die Datenhaltung (DataStore)
-#   - die Logik (ProgressService, GradeService)
+#   - die Logik (Funktionen aus services.py)
 #   - und die Anzeige (UI).
 #
 # Aufgaben:
@@ -16,39 +16,42 @@
 #   - Robuste Typ- und Werteprüfung
 
 from __future__ import annotations
-from datetime import date, datetime
-from typing import Any, Dict
-from services import ProgressService, GradeService, DURATION_MONTHS
+import functools
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+from services import progress_ist, progress_soll, ampel, is_ok, DURATION_MONTHS
 from store import DataStore
 
 
 class DashboardController:
     """Zentrale Steuerung zwischen Daten, Logik und Anzeige."""
 
-    def __init__(self, store: DataStore,
-                 psvc: ProgressService,
-                 gsvc: GradeService) -> None:
+    def __init__(self, store: DataStore) -> None:
         """Initialisiert Controller und lädt aktuelle Konfiguration."""
         self.store = store
-        self.psvc = psvc
-        self.gsvc = gsvc
         self.cfg: Dict[str, Any] = self.store.load()
 
     # ------------------------------------------------------------------ #
     # Konfigurationszugriff
     # ------------------------------------------------------------------ #
-    def get_cfg(self) -> Dict[str, Any]:
-        """Gibt eine Kopie der gespeicherten Konfiguration zurück."""
-        return dict(self.cfg)
+    def get_cfg(self) -> Mapping[str, Any]:
+        """Gibt eine schreibgeschützte Sicht auf die Konfiguration zurück.
+
+        Keine Kopie: Änderungen nur über update_cfg(); direkte Schreibzugriffe
+        lösen einen TypeError aus.
+        """
+        return MappingProxyType(self.cfg)
 
     def update_cfg(self, **kwargs: Any) -> None:
         """Aktualisiert Werte in der Konfiguration und speichert sie."""
         allowed = {"program", "name", "ects_total", "ects_done",
                    "start", "avg_grade"}
-        for k, v in kwargs.items():
-            if k in allowed:
-                self.cfg[k] = v
-        self.store.save(self.cfg)
+        updates = {k: v for k, v in kwargs.items() if k in allowed}
+        # Neues Dict statt self.cfg zu ändern: ausgegebene get_cfg()-Sichten
+        # sehen so nie ungeprüfte Werte. Der Store liefert die bereinigten
+        # Werte zurück → self.cfg ist immer geprüft.
+        self.cfg = self.store.save({**self.cfg, **updates})
 
     def onboarding_done(self) -> bool:
         """Prüft, ob Name & Studiengang eingetragen sind."""
@@ -62,16 +65,12 @@ class DashboardController:
         if today is None:
             today = date.today()
 
-        ects_total = self._as_int(self.cfg.get("ects_total", 180), 1, 180)
-        ects_done = self._as_int(self.cfg.get("ects_done", 0), 0, ects_total)
-        avg_grade = self._as_float(self.cfg.get("avg_grade", 3.0), 1.0, 5.0)
-        start_dt = self._parse_date(self.cfg.get("start"), today)
-
-        # Fortschritt & Status berechnen
-        ist_pct = self.psvc.progress_ist(ects_done, ects_total)
-        soll_pct = self.psvc.progress_soll(start_dt, today, DURATION_MONTHS)
-        color, label = self.psvc.ampel(ist_pct, soll_pct, ects_total)
-        grade_ok = self.gsvc.is_ok(avg_grade)
+        # self.cfg stammt immer aus store.load()/save() und ist laut
+        # DataStore-Vertrag vollständig & bereinigt – kein erneutes Klemmen.
+        (ects_total, ects_done, avg_grade, start_dt,
+         ist_pct, soll_pct, color, label, grade_ok) = _compute_vm(
+            self.cfg["ects_total"], self.cfg["ects_done"],
+            self.cfg["avg_grade"], self.cfg["start"], today.toordinal())
 
         return {
             "ects_total": ects_total,
@@ -85,32 +84,37 @@ class DashboardController:
             "grade_ok": grade_ok,
         }
 
-    # ------------------------------------------------------------------ #
-    # Hilfsfunktionen
-    # ------------------------------------------------------------------ #
-    @staticmethod
-    def _parse_date(val: Any, fallback: date) -> date:
-        try:
-            if isinstance(val, date):
-                return val
-            if isinstance(val, str):
-                return datetime.fromisoformat(val).date()
-        except Exception:
-            pass
-        return fallback
-
-    @staticmethod
-    def _as_int(val: Any, lo: int, hi: int) -> int:
-        try:
-            x = int(val)
-        except Exception:
-            x = lo
-        return max(lo, min(hi, x))
-
-    @staticmethod
-    def _as_float(val: Any, lo: float, hi: float) -> float:
-        try:
-            x = float(val)
-        except Exception:
-            x = lo
-        return max(lo, min(hi, x))
+
+# ---------------------------------------------------------------------- #
+# Hilfsfunktionen & zwischengespeicherte ViewModel-Berechnung
+# ---------------------------------------------------------------------- #
+def _parse_date(val: Any, fallback: date) -> date:
+    try:
+        if isinstance(val, date):
+            return val
+        if isinstance(val, str):
+            return date.fromisoformat(val)
+    except Exception:
+        pass
+    return fallback
+
+
+@functools.lru_cache(maxsize=128)
+def _compute_vm(ects_total: int, ects_done: int, avg_grade: float,
+                start_iso: str, today_ord: int) -> Tuple[Any, ...]:
+    """Berechnet die ViewModel-Werte aus reinen Basisdaten.
+
+    Alle Argumente sind unveränderliche Grundtypen und bilden den Cache-Key;
+    ändert sich ein Wert (oder der Tag), wird automatisch neu berechnet.
+    """
+    today = date.fromordinal(today_ord)
+    start_dt = _parse_date(start_iso, today)
+
+    # Fortschritt & Status berechnen
+    ist_pct = progress_ist(ects_done, ects_total)
+    soll_pct = progress_soll(start_dt, today, DURATION_MONTHS)
+    color, label = ampel(ist_pct, soll_pct, ects_total)
+    grade_ok = is_ok(avg_grade)
+
+    return (ects_total, ects_done, avg_grade, start_dt,
+            ist_pct, soll_pct, color, label, grade_ok)
@@ -9,6 +9,7 @@
 # - Enums: ExamType, ExamStatus (und optional AmpelStatus für Typisierungen).
 # - Kardinalität: Ein Modul hat 0..3 Prüfungsleistungen (Versuche).
 # - Ein Modul gilt als "abgeschlossen", sobald eine Prüfungsleistung bestanden ist.
+# - Dataclasses mit slots=True (Python 3.10+): weniger Speicher, schnellerer Attributzugriff.
 
 from __future__ import annotations
 
@@ -46,7 +47,7 @@ class AmpelStatus(Enum):
 # Entities
 # --------------------------------------------------------------------------- #
 
-@dataclass
+@dataclass(slots=True)
 class Pruefungsleistung:
     """Eine einzelne Prüfungsleistung (Versuch) zu einem Modul."""
     typ: ExamType
@@ -56,10 +57,10 @@ class Pruefungsleistung:
 
     def ist_bestanden(self) -> bool:
         """True, wenn diese Prüfungsleistung bestanden ist."""
-        return self.status == ExamStatus.BESTANDEN
+        return self.status is ExamStatus.BESTANDEN
 
 
-@dataclass
+@dataclass(slots=True)
 class Modul:
     """Ein Modul mit bis zu 3 Prüfungsleistungen (Versuchen)."""
     code: str
@@ -76,15 +77,22 @@ class Modul:
 
     def abgeschlossen(self) -> bool:
         """True, wenn mindestens eine Prüfungsleistung bestanden wurde."""
-        return any(p.ist_bestanden() for p in self.pruefungen)
+        for p in self.pruefungen:
+            if p.status is ExamStatus.BESTANDEN:
+                return True
+        return False
 
     def beste_note(self) -> Optional[float]:
         """Gibt die beste (niedrigste) Note einer bestandenen Prüfungsleistung zurück, sonst None."""
-        noten = [p.note for p in self.pruefungen if p.ist_bestanden() and p.note is not None]
-        return min(noten) if noten else None
+        best: Optional[float] = None
+        for p in self.pruefungen:
+            if p.status is ExamStatus.BESTANDEN and p.note is not None:
+                if best is None or p.note < best:
+                    best = p.note
+        return best
 
 
-@dataclass
+@dataclass(slots=True)
 class Semester:
     """Ein Semester umfasst mehrere Module und hat (idealerweise) Start/Ende."""
     nummer: int
@@ -111,7 +119,7 @@ class Semester:
         return sum(m.ects for m in self.module if m.abgeschlossen())
 
 
-@dataclass
+@dataclass(slots=True)
 class Studiengang:
     """Der komplette Studiengang mit allen Semestern."""
     name: str
@@ -1,8 +1,9 @@
 # services.py – Berechnungs-Logik für Fortschritt und Noten
 #
-# Enthält:
-#   - ProgressService: Fortschritt, Ampel-Bewertung
-#   - GradeService: Bewertung der Durchschnittsnote
+# Enthält (als einfache Funktionen, ohne Klassen/Zustand):
+#   - Fortschritt: progress_ist, progress_soll, months_since
+#   - Ampel-Bewertung: ampel
+#   - Bewertung der Durchschnittsnote: is_ok
 #
 # Änderungen (11/2025):
 #   - ECTS-Maximalwert 180 bleibt fix.
@@ -17,76 +18,73 @@ DURATION_MONTHS = 54
 ECTS_MAX = 180
 
 
-class ProgressService:
-    """Berechnet Studienfortschritt und Ampelstatus."""
-
-    # ------------------- Hilfsfunktionen ------------------- #
-    @staticmethod
-    def _clamp_int(x: int, lo: int, hi: int) -> int:
+# ------------------- Hilfsfunktionen ------------------- #
+def _clamp_int(x: int, lo: int, hi: int) -> int:
+    # Normalfall int: kein try/except nötig
+    if type(x) is int:
+        v = x
+    else:
         try:
             v = int(x)
         except Exception:
             v = lo
-        return max(lo, min(hi, v))
-
-    @staticmethod
-    def _clamp_float(x: float, lo: float, hi: float) -> float:
-        try:
-            v = float(x)
-        except Exception:
-            v = lo
-        return max(lo, min(hi, v))
-
-    # ------------------- öffentliche API ------------------- #
-    @staticmethod
-    def months_since(start: date, today: date) -> int:
-        """Berechnet Monate seit Studienstart."""
-        return max(0, (today.year - start.year) * 12 + (today.month - start.month))
-
-    @staticmethod
-    def progress_ist(ects_done: int, ects_total: int) -> float:
-        """Berechnet IST-Fortschritt (0.0-1.0)."""
-        ects_total = ProgressService._clamp_int(ects_total, 1, ECTS_MAX)
-        ects_done = ProgressService._clamp_int(ects_done, 0, ects_total)
-        return ects_done / ects_total if ects_total else 0.0
-
-    @staticmethod
-    def progress_soll(start: date, today: date,
-                      duration_months: int = DURATION_MONTHS) -> float:
-        """Berechnet SOLL-Fortschritt (0.0-1.0)."""
-        duration_months = ProgressService._clamp_int(duration_months, 1, 9999)
-        m = ProgressService.months_since(start, today)
-        return min(m / duration_months, 1.0)
-
-    @staticmethod
-    def ampel(ist: float, soll: float, ects_total: int = 180) -> tuple[str, str]:
-        """Bewertet Fortschritt nach Ampellogik.
-
-        - Grün:   im Plan
-        - Gelb:   Rückstand ≤ 10 ECTS
-        - Rot:    Rückstand > 10 ECTS
-        """
-        ist = ProgressService._clamp_float(ist, 0.0, 1.0)
-        soll = ProgressService._clamp_float(soll, 0.0, 1.0)
-        ects_total = ProgressService._clamp_int(ects_total, 1, ECTS_MAX)
-
-        diff_ects = abs((soll - ist) * ects_total)
-
-        if ist >= soll:
-            return "green", "im Plan"
-        if diff_ects <= 10:
-            return "yellow", "etwas hinten dran"
-        return "red", "deutlich verzögert"
-
-
-class GradeService:
-    """Prüft, ob die Durchschnittsnote akzeptabel ist."""
-
-    @staticmethod
-    def is_ok(avg_grade: float, threshold: float = 3.0) -> bool:
-        """True, wenn Note ≤ threshold."""
-        try:
-            g = float(avg_grade)
-        except Exception:
-            g = 5.0
-        return g <= threshold
+    if v < lo:
+        return lo
+    return v if v <= hi else hi
+
+
+# ------------------- Fortschritt ------------------- #
+def months_since(start: date, today: date) -> int:
+    """Berechnet Monate seit Studienstart."""
+    # Attribute einmal in lokale Variablen lesen (exakt, keine Tages-Näherung)
+    ty, tm = today.year, today.month
+    sy, sm = start.year, start.month
+    m = (ty - sy) * 12 + (tm - sm)
+    return m if m > 0 else 0
+
+
+def progress_ist(ects_done: int, ects_total: int) -> float:
+    """Berechnet IST-Fortschritt (0.0-1.0)."""
+    ects_total = _clamp_int(ects_total, 1, ECTS_MAX)
+    ects_done = _clamp_int(ects_done, 0, ects_total)
+    return ects_done / ects_total if ects_total else 0.0
+
+
+def progress_soll(start: date, today: date,
+                  duration_months: int = DURATION_MONTHS) -> float:
+    """Berechnet SOLL-Fortschritt (0.0-1.0)."""
+    duration_months = _clamp_int(duration_months, 1, 9999)
+    m = months_since(start, today)
+    return min(m / duration_months, 1.0)
+
+
+def ampel(ist: float, soll: float, ects_total: int = 180) -> tuple[str, str]:
+    """Bewertet Fortschritt nach Ampellogik.
+
+    - Grün:   im Plan
+    - Gelb:   Rückstand ≤ 10 ECTS
+    - Rot:    Rückstand > 10 ECTS
+
+    Erwartet bereits geprüfte Werte (aus progress_ist/progress_soll und der
+    bereinigten Konfiguration) – es wird daher nicht erneut geklemmt.
+    """
+    assert 0.0 <= ist <= 1.0 and 0.0 <= soll <= 1.0, (ist, soll)
+    assert 1 <= ects_total <= ECTS_MAX, ects_total
+
+    diff_ects = abs((soll - ist) * ects_total)
+
+    if ist >= soll:
+        return "green", "im Plan"
+    if diff_ects <= 10:
+        return "yellow", "etwas hinten dran"
+    return "red", "deutlich verzögert"
+
+
+# ------------------- Noten ------------------- #
+def is_ok(avg_grade: float, threshold: float = 3.0) -> bool:
+    """True, wenn Note ≤ threshold."""
+    try:
+        g = float(avg_grade)
+    except Exception:
+        g = 5.0
+    return g <= threshold
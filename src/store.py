@@ -16,19 +16,34 @@ from __future__ import annotations
 
 import os
 import json
-from datetime import date, datetime
-from typing import Dict, Any
+import tempfile
+from datetime import date
+from typing import Dict, Any, Tuple
+
+
+# Zuletzt gelesene/geschriebene Daten je Datei: Pfad → ((mtime_ns, Größe), Dict).
+# Auf Modulebene, weil Streamlit bei jedem Rerun einen neuen JsonStore anlegt;
+# ist die Datei unverändert, spart load() so das Öffnen + Parsen.
+_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
 
 class DataStore:
     """Abstrakte Basis für verschiedene Speicherarten (Interface)."""
 
     def load(self) -> dict:
-        """Lädt gespeicherte Daten und gibt sie als Dict zurück."""
+        """Lädt gespeicherte Daten und gibt sie als Dict zurück.
+
+        Das Dict ist immer vollständig und bereinigt: alle Basis-Keys sind
+        vorhanden, Typen und Wertebereiche geprüft (ggf. Defaults).
+        """
         raise NotImplementedError
 
-    def save(self, cfg: dict) -> None:
-        """Speichert die übergebenen Daten."""
+    def save(self, cfg: dict) -> dict:
+        """Speichert die übergebenen Daten und gibt die gespeicherte Form zurück.
+
+        Wie bei load() ist das zurückgegebene Dict vollständig und bereinigt;
+        der Controller verlässt sich darauf und prüft nicht erneut.
+        """
         raise NotImplementedError
 
 
@@ -38,13 +53,15 @@ class JsonStore(DataStore):
     # Erlaubte Schlüssel (Whitelisting, damit nichts „wildes“ gespeichert wird)
     _ALLOWED_KEYS = {"program", "name", "ects_total", "ects_done", "start", "avg_grade"}
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, pretty: bool = False) -> None:
         """Legt den Speicher an und sorgt bei Bedarf für den Ordner.
 
         Args:
             path: Pfad zur JSON-Datei, z. B. "data/basic_config.json".
+            pretty: True → JSON eingerückt speichern (für Menschen lesbar).
         """
         self.path = path
+        self.pretty = pretty
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
     # --------------------------- Defaults --------------------------------- #
@@ -63,20 +80,33 @@ class JsonStore(DataStore):
     @staticmethod
     def _clamp_int(x: Any, lo: int, hi: int) -> int:
         """Ganzzahl in [lo, hi] klemmen (robust)."""
-        try:
-            v = int(x)
-        except Exception:
-            v = lo
-        return max(lo, min(hi, v))
+        # Schneller Weg: aus JSON kommt meist schon ein int
+        if type(x) is int:
+            v = x
+        else:
+            try:
+                v = int(x)
+            except Exception:
+                v = lo
+        if v < lo:
+            return lo
+        return v if v <= hi else hi
 
     @staticmethod
     def _clamp_float(x: Any, lo: float, hi: float) -> float:
         """Float in [lo, hi] klemmen (robust)."""
-        try:
-            v = float(x)
-        except Exception:
-            v = lo
-        return max(lo, min(hi, v))
+        # Schneller Weg: float ohne Umweg über try/except (große ints können
+        # bei float() überlaufen und laufen daher über den try-Zweig)
+        if type(x) is float:
+            v = x
+        else:
+            try:
+                v = float(x)
+            except Exception:
+                v = lo
+        if v < lo:
+            return lo
+        return v if v <= hi else hi
 
     @staticmethod
     def _iso_or_today(x: Any) -> str:
@@ -85,7 +115,7 @@ class JsonStore(DataStore):
             return x.isoformat()
         if isinstance(x, str):
             try:
-                return datetime.fromisoformat(x).date().isoformat()
+                return date.fromisoformat(x).isoformat()
             except Exception:
                 pass
         return date.today().isoformat()
@@ -122,9 +152,20 @@ class JsonStore(DataStore):
     # ------------------------------ API ----------------------------------- #
     def load(self) -> Dict[str, Any]:
         """Lädt Daten aus JSON. Bei Fehlern werden Defaults genutzt."""
-        if not os.path.exists(self.path) or os.stat(self.path).st_size == 0:
+        key = os.path.abspath(self.path)
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            _CACHE.pop(key, None)
+            return self._defaults()
+        if st.st_size == 0:
             return self._defaults()
 
+        # Datei seit dem letzten Lesen/Schreiben unverändert → Cache nutzen
+        cached = _CACHE.get(key)
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            return dict(cached[1])
+
         try:
             with open(self.path, "r", encoding="utf-8") as f:
                 raw = json.load(f)
@@ -133,10 +174,48 @@ class JsonStore(DataStore):
             return self._defaults()
 
         # Fehlende Felder auffüllen + Werte bereinigen
-        return self._sanitize(raw if isinstance(raw, dict) else {})
+        clean = self._sanitize(raw if isinstance(raw, dict) else {})
+        _CACHE[key] = ((st.st_mtime_ns, st.st_size), dict(clean))
+        return clean
 
-    def save(self, cfg: Dict[str, Any]) -> None:
-        """Speichert bereinigte Daten als JSON (UTF-8, hübsch eingerückt)."""
+    def save(self, cfg: Dict[str, Any]) -> Dict[str, Any]:
+        """Speichert bereinigte Daten als JSON (UTF-8, kompakt).
+
+        Geschrieben wird zuerst in eine temporäre Datei, die auf die Platte
+        geschrieben (fsync) und dann per os.replace() gegen die alte getauscht
+        wird. Ein Absturz mitten im Schreiben lässt die alte Konfiguration
+        damit in aller Regel unbeschädigt.
+
+        Returns:
+            Die bereinigten Daten, so wie sie gespeichert wurden.
+        """
         clean = self._sanitize(cfg if isinstance(cfg, dict) else {})
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(clean, f, ensure_ascii=False, indent=2)
+        if self.pretty:
+            text = json.dumps(clean, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(clean, ensure_ascii=False, separators=(",", ":"))
+
+        # Eigene Temp-Datei je Aufruf: Streamlit-Sessions laufen als Threads
+        # in einem Prozess und dürfen sich beim Speichern nicht in die Quere kommen
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".",
+                                   prefix=os.path.basename(self.path) + ".",
+                                   suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        finally:
+            # Nach Erfolg existiert tmp nicht mehr; nach einem Fehler aufräumen
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        key = os.path.abspath(self.path)
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            _CACHE.pop(key, None)
+            return clean
+        _CACHE[key] = ((st.st_mtime_ns, st.st_size), dict(clean))
+        return clean
@@ -9,10 +9,10 @@
 
 from __future__ import annotations
 import os
-from datetime import date, datetime
+from datetime import date
+from math import pi
 import streamlit as st
 from controller import DashboardController
-from services import ProgressService, GradeService
 from store import JsonStore
 
 # ---------------------- Pfade ---------------------- #
@@ -22,9 +22,10 @@ CONFIG_PATH = os.path.join(DATA_DIR, "basic_config.json")
 
 st.set_page_config(page_title="Studien-Dashboard", layout="wide")
 
-controller = DashboardController(JsonStore(CONFIG_PATH),
-                                 ProgressService(),
-                                 GradeService())
+# ---------------------- Diagramm-Stil ---------------------- #
+RING_BG, RING_FG = "#6B7280", "#1E90FF"
+
+controller = DashboardController(JsonStore(CONFIG_PATH))
 
 # ---------------------- Hilfsfunktionen ---------------------- #
 def _parse_date_or_today(val: str | date | None) -> date:
@@ -32,7 +33,7 @@ def _parse_date_or_today(val: str | date | None) -> date:
         return val
     if isinstance(val, str):
         try:
-            return datetime.fromisoformat(val).date()
+            return date.fromisoformat(val)
         except Exception:
             pass
     return date.today()
@@ -51,26 +52,31 @@ def status_dot(color_hex: str, label: str) -> None:
     st.markdown(html, unsafe_allow_html=True)
 
 
-def donut_chart(percent: float, title: str, scale: float = 0.5):
-    """Einfaches Donut-Diagramm."""
-    import matplotlib.pyplot as plt
-    import matplotlib as mpl
-    BG, RING_BG, RING_FG = "#0E1117", "#6B7280", "#1E90FF"
-    mpl.rcParams.update({"text.color": "white",
-                         "axes.facecolor": BG,
-                         "figure.facecolor": BG})
-    size = 3.0 * scale
-    fig, ax = plt.subplots(figsize=(size, size), dpi=200)
+def donut_svg(percent: float, title: str, size_px: int = 150) -> str:
+    """Einfaches Donut-Diagramm als SVG (zwei Kreise, kein Matplotlib).
+
+    Der Fortschrittsring entsteht über ``stroke-dasharray``: Länge des
+    sichtbaren Bogens = Anteil × Kreisumfang.
+    """
     val = max(0.0, min(1.0, float(percent)))
-    ax.pie([1], startangle=90, colors=[RING_BG], radius=1.0,
-           wedgeprops=dict(width=0.40, edgecolor=BG))
-    if val > 0:
-        ax.pie([val, 1-val], startangle=90, colors=[RING_FG, (0,0,0,0)],
-               radius=1.0,
-               wedgeprops=dict(width=0.40, edgecolor=BG, linewidth=0.5))
-    ax.set_aspect("equal")
-    ax.set_title(f"{title}\n{val*100:.0f}%", fontsize=7, pad=4)
-    return fig
+    c = size_px / 2
+    width = size_px * 0.2                 # Ringbreite (40 % des Radius)
+    r = c - width / 2                     # Radius der Ringmitte
+    circ = 2 * pi * r
+    title_html = title.strip().replace("\n", "<br>")
+    return (f"<div style='text-align:center;font-size:0.8rem;'>"
+            f"{title_html}<br>{val*100:.0f}%</div>"
+            f"<div style='text-align:center;'>"
+            f"<svg width='{size_px}' height='{size_px}' "
+            f"viewBox='0 0 {size_px} {size_px}'>"
+            f"<circle cx='{c}' cy='{c}' r='{r:.2f}' fill='none' "
+            f"stroke='{RING_BG}' stroke-width='{width:.2f}'/>"
+            f"<circle cx='{c}' cy='{c}' r='{r:.2f}' fill='none' "
+            f"stroke='{RING_FG}' stroke-width='{width:.2f}' "
+            f"stroke-dasharray='{val*circ:.2f} {circ:.2f}' "
+            f"transform='rotate(-90 {c} {c})'/>"
+            f"</svg></div>")
+
 
 # ---------------------- Hauptfunktion ---------------------- #
 def main() -> None:
@@ -136,6 +142,7 @@ def main() -> None:
     st.sidebar.caption("Hinweis: ECTS nur in 5er-Schritten, max. 180 ECTS.")
 
     # ---------- Kennzahlen ---------- #
+    # compute_viewmodel ist selbst zwischengespeichert (lru_cache im Controller)
     vm = controller.compute_viewmodel(today=date.today())
     st.markdown("### Kennzahlen")
     left, mid, right = st.columns([1, 2, 1])
@@ -170,11 +177,13 @@ def main() -> None:
     st.markdown("### Zeitplan (visuell)")
     left_spacer, c1, c2, right_spacer = st.columns([1.1, 3, 3, 3.9])
     with c1:
-        st.pyplot(donut_chart(vm["soll_pct"],
-                              "SOLL Zeitplan % \nErwarteter Fortschritt", 0.5))
+        st.markdown(donut_svg(vm["soll_pct"],
+                              "SOLL Zeitplan % \nErwarteter Fortschritt"),
+                    unsafe_allow_html=True)
     with c2:
-        st.pyplot(donut_chart(vm["ist_pct"],
-                              "IST Zeitplan % \nTatsächlicher Fortschritt", 0.5))
+        st.markdown(donut_svg(vm["ist_pct"],
+                              "IST Zeitplan % \nTatsächlicher Fortschritt"),
+                    unsafe_allow_html=True)
 
 
 if __name__ == "__main__":